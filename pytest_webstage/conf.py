@@ -1,22 +1,57 @@
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 import tomllib
-from typing import Literal
-from pydantic import BaseModel, Field
+from typing import Iterable, Literal
 
-class Browser(BaseModel):
+_CACHED_BROWSERS_CHOICES = frozenset({"always", "auto", "no"})
+
+@dataclass(slots=True, frozen=True)
+class Browser:
     browser: str
     version: str = "stable"
 
 
-class Config(BaseModel):
+@dataclass(slots=True, frozen=True)
+class Config:
     cached_browsers: Literal["always"] | Literal["auto"] | Literal["no"] = "auto"
-    browsers: list[Browser] = Field(default_factory=list)
+    browsers: tuple[Browser, ...] = ()
+
+def lookup_workers(cached_browsers: Iterable[str], count: int) -> int:
+    """Return the number of concurrent Selenium Manager lookups for `count` browsers.
+
+    Forced downloads ("always") write to the same selenium cache directory and metadata file,
+    so they are never run concurrently.
+    """
+    if any(c == "always" for c in cached_browsers):
+        return 1
+    return max(1, min(8, count))
 
 def read_config(path: str | Path) -> Config:
     path = Path(path)
     if not path.is_file():
         path = path / "webstage.toml"
+    return _read_config(path.resolve())
+
+@lru_cache(maxsize=1)
+def _read_config(path: Path) -> Config:
     with open(path, 'rb') as f:
         root = tomllib.load(f)
     conf = root.get('tool', {}).get('webstage', {})
-    return Config(**conf)
+    cached_browsers = conf.get("cached_browsers", "auto")
+    if cached_browsers not in _CACHED_BROWSERS_CHOICES:
+        raise ValueError(
+            f"invalid cached_browsers: {cached_browsers!r} in {path}. (available choices: {', '.join(sorted(_CACHED_BROWSERS_CHOICES))})"
+        )
+    browsers = tuple(_read_browser(path, b) for b in conf.get("browsers", []))
+    return Config(cached_browsers=cached_browsers, browsers=browsers)
+
+def _read_browser(path: Path, b: dict) -> Browser:
+    if "browser" not in b:
+        raise ValueError(f"missing browser name in browsers of {path}")
+    browser, version = b["browser"], b.get("version", "stable")
+    if not isinstance(browser, str):
+        raise ValueError(f"invalid browser: {browser!r} in {path}, expected a string")
+    if not isinstance(version, str):
+        raise ValueError(f"invalid version of {browser}: {version!r} in {path}, expected a string")
+    return Browser(browser=browser, version=version)
@@ -1,4 +1,4 @@
-from typing import Any, Generator, Iterable, Literal, cast
+from typing import Any, Callable, Generator, Iterable, Literal, cast
 import pytest
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.service import Service
@@ -11,17 +11,44 @@ from selenium.webdriver import (
     ChromeService,
 )
 from selenium.webdriver.common.selenium_manager import SeleniumManager
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
 from .webstage import WebStage
 from itertools import repeat
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from .conf import read_config
+import warnings
+from .conf import lookup_workers, read_config
 
 
-@dataclass
+@dataclass(slots=True)
 class BrowserOptions:
+    browser: str
     version: str
 
 
+_BrowserFactories = tuple[
+    type[Service],
+    type[FirefoxOptions] | type[ChromeOptions],
+    Callable[..., WebDriver],
+    str,
+]
+
+# Browser name -> service, options and driver classes,
+# and the commandline argument for headless mode.
+_BROWSER_REGISTRY: dict[str, _BrowserFactories] = {
+    "firefox": (FirefoxService, FirefoxOptions, Firefox, "-headless"),
+    "chrome": (ChromeService, ChromeOptions, Chrome, "--headless=new"),
+}
+
+
+def _browser_factories(name: str) -> _BrowserFactories:
+    try:
+        return _BROWSER_REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"unsupported browser name: {name}") from None
+
+
 def pytest_addoption(parser: pytest.Parser):
     g = parser.getgroup(
         "webstage",
@@ -84,29 +111,31 @@ def pytest_generate_tests(metafunc: pytest.Metafunc):
                 f"unsupported browser names: {' ,'.join(unsupported_names)}. (supported names: {' ,'.join(ALL_SUPPORTED_BROWSERS)})"
             )
         variants: list[tuple[str, str, Literal["auto"] | Literal["always"] | Literal["no"]]] = []
-        for name in browser_names:
-            versions = cast(
-                Iterable[str],
-                metafunc.config.getoption(f"{name}_version", cast(Any, None)),
-            ) or ["stable"]
-            variants.extend(zip(repeat(name), versions, repeat("auto")))
+        if browser_names:
+            for name in browser_names:
+                versions = cast(
+                    Iterable[str],
+                    metafunc.config.getoption(f"{name}_version", cast(Any, None)),
+                ) or ["stable"]
+                variants.extend(zip(repeat(name), versions, repeat("auto")))
         else:
             conf = read_config(".")
-            for b in conf.browsers:
-                if b.browser not in ALL_SUPPORTED_BROWSERS:
-                    raise ValueError(
-                        f"unsupported browser names: {b.browser}. (supported names: {' ,'.join(ALL_SUPPORTED_BROWSERS)})"
-                    )
-                variants.append((b.browser, b.version, conf.cached_browsers))
+            unsupported = [b.browser for b in conf.browsers if b.browser not in ALL_SUPPORTED_BROWSERS]
+            if unsupported:
+                raise ValueError(
+                    f"unsupported browser names: {' ,'.join(unsupported)}. (supported names: {' ,'.join(ALL_SUPPORTED_BROWSERS)})"
+                )
+            variants.extend((b.browser, b.version, conf.cached_browsers) for b in conf.browsers)
+        variants = list(dict.fromkeys(variants))
         metafunc.parametrize(
             "browser_config",
             variants,
             indirect=True,
-            ids=(f"{name}({version})" for name, version, _ in variants),
+            ids=[f"{name}({version})" for name, version, _ in variants],
         )
 
 
-ALL_SUPPORTED_BROWSERS = {"firefox", "chrome"}
+ALL_SUPPORTED_BROWSERS = frozenset(_BROWSER_REGISTRY)
 
 
 def _check_headless(request: pytest.FixtureRequest, name: str):
@@ -125,18 +154,80 @@ def _check_headless(request: pytest.FixtureRequest, name: str):
     else:
         return False
 
-@dataclass
+@dataclass(slots=True)
 class BrowserConfig:
     browser: str
     version: str
     driver_path: str
     browser_path: str
 
+
+# pytest may instantiate a session-scoped, indirectly parametrized fixture
+# once per parameter position instead of once per value, so the
+# (subprocess-spawning) lookups are cached here explicitly.
+_BINARY_PATHS_CACHE: dict[tuple[str, str, str], Future[dict]] = {}
+
+
+# Variants of the selected tests, resolved together on the first browser_config request.
+_PENDING_VARIANTS: dict[tuple[str, str, str], None] = {}
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list[pytest.Item]):
+    # Runs after the deselection (like -k), so unselected browsers are not looked up
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "browser_config" in callspec.params:
+            _PENDING_VARIANTS[callspec.params["browser_config"]] = None
+
+
 @pytest.fixture(scope="session")
 def browser_config(request: pytest.FixtureRequest) -> BrowserConfig:
-    mgr = SeleniumManager()
-    offline = request.config.getoption("webstage_offline", cast(Any, None))
     browser, version, cached_browser = request.param
+    key = (browser, version, cached_browser)
+    if key not in _BINARY_PATHS_CACHE:
+        _PENDING_VARIANTS[key] = None
+        _prewarm_binary_paths(request.config)
+    result = _BINARY_PATHS_CACHE[key].result()
+    if result['code'] != 0:
+        raise LookupError(f"could not find browser {browser}({version}), use \"webstage check-cache\" to update local cache")
+
+    return BrowserConfig(
+        browser=browser,
+        version=version,
+        driver_path=result['driver_path'],
+        browser_path=result['browser_path'],
+    )
+
+
+def _prewarm_binary_paths(config: pytest.Config):
+    """Resolve all pending variants concurrently and fill `_BINARY_PATHS_CACHE`.
+
+    The finished futures are cached, so a failed lookup raises its exception again on `.result()`.
+    """
+    pending = [k for k in _PENDING_VARIANTS if k not in _BINARY_PATHS_CACHE]
+    _PENDING_VARIANTS.clear()
+    if not pending:
+        return
+    workers = lookup_workers((cached for _, _, cached in pending), len(pending))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for key in pending:
+            _BINARY_PATHS_CACHE[key] = ex.submit(_binary_paths, config, *key)
+
+
+_MGR: SeleniumManager | None = None
+
+
+def _get_mgr() -> SeleniumManager:
+    global _MGR
+    if _MGR is None:
+        _MGR = SeleniumManager()
+    return _MGR
+
+
+def _binary_paths(config: pytest.Config, browser: str, version: str, cached_browser: str) -> dict:
+    mgr = _get_mgr()
+    offline = config.getoption("webstage_offline", cast(Any, None))
     args = ["--browser", browser, "--browser-version", version]
     if offline:
         args.append("--offline")
@@ -147,16 +238,7 @@ def browser_config(request: pytest.FixtureRequest) -> BrowserConfig:
             args.append("--avoid-browser-download")
         case _:
             pass
-    result = mgr.binary_paths(args)
-    if result['code'] != 0:
-        raise LookupError(f"could not find browser {browser}({version}), use \"webstage check-cache\" to update local cache")
-
-    return BrowserConfig(
-        browser=browser,
-        version=version,
-        driver_path=result['driver_path'],
-        browser_path=result['browser_path'],
-    )
+    return mgr.binary_paths(args)
 
 
 @pytest.fixture(scope="session")
@@ -164,15 +246,53 @@ def browser_service(browser_config: BrowserConfig) -> tuple[Service, BrowserOpti
     """
     Get long-live browser service instance and browser options.
     """
-    match browser_config.browser:
-        case "firefox":
-            return FirefoxService(executable_path=browser_config.driver_path), BrowserOptions(version=browser_config.version)
-        case "chrome":
-            return ChromeService(executable_path=browser_config.driver_path), BrowserOptions(
-                version=browser_config.version
-            )
-        case _:
-            raise ValueError(f"unsupported browser name: {browser_config.browser}")
+    svc_cls, _, _, _ = _browser_factories(browser_config.browser)
+    return svc_cls(executable_path=browser_config.driver_path), BrowserOptions(
+        browser=browser_config.browser,
+        version=browser_config.version,
+    )
+
+
+# Live browsers keyed by (browser, version). pytest does not deduplicate session-scoped,
+# indirectly parametrized fixtures by value, so the browsers are reused explicitly
+# and quit in pytest_sessionfinish.
+_DRIVER_CACHE: dict[tuple[str, str], WebDriver] = {}
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int):
+    while _DRIVER_CACHE:
+        (browser, version), driver = _DRIVER_CACHE.popitem()
+        try:
+            driver.quit()
+        except Exception as e:
+            warnings.warn(f"could not quit browser {browser}({version}): {e}", RuntimeWarning)
+
+
+def _reset_driver(driver: WebDriver):
+    """Clear the state left by the previous test in a reused browser.
+
+    The test continues in a new tab with an empty history, the old windows are closed.
+    Cookies, localStorage and sessionStorage are cleared for the origins of the old windows.
+    Chromium-based browsers also drop the cookies of all other sites.
+    """
+    handles = driver.window_handles
+    for handle in handles:
+        driver.switch_to.window(handle)
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+        if driver.current_url.startswith(("http:", "https:")):
+            driver.delete_all_cookies()
+            driver.execute_script("localStorage.clear(); sessionStorage.clear();")
+    driver.switch_to.new_window("tab")
+    fresh = driver.current_window_handle
+    for handle in handles:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(fresh)
+    if isinstance(driver, ChromiumDriver):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
 
 
 @pytest.fixture
@@ -181,26 +301,30 @@ def browser(
     browser_config: BrowserConfig,
     request: pytest.FixtureRequest
 ) -> Generator[WebDriver, Any, None]:
-    serv, opts = browser_service
-
-    if isinstance(serv, FirefoxService):
-        ffopts = FirefoxOptions()
-        if _check_headless(request, "firefox"):
-            ffopts.add_argument("-headless")
-        ffopts.browser_version = opts.version
-        ffopts.binary_location = browser_config.browser_path
-        with Firefox(service=serv, options=ffopts) as firefox:
-            yield firefox
-    elif isinstance(serv, ChromeService):
-        cropts = ChromeOptions()
-        cropts.browser_version = opts.version
-        cropts.binary_location = browser_config.browser_path
-        if _check_headless(request, "chrome"):
-            cropts.add_argument("--headless=new")
-        with Chrome(service=serv, options=cropts) as cr:
-            yield cr
-    else:
-        raise ValueError(f"unsupported service: {type(browser_service)}")
+    key = (browser_config.browser, browser_config.version)
+    driver = _DRIVER_CACHE.get(key)
+    if driver is not None:
+        try:
+            _reset_driver(driver)
+        except WebDriverException:
+            # The browser is gone or stuck, start a new one
+            del _DRIVER_CACHE[key]
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            driver = None
+    if driver is None:
+        serv, opts = browser_service
+        _, opt_cls, drv_cls, headless_arg = _browser_factories(opts.browser)
+
+        drvopts = opt_cls()
+        if _check_headless(request, opts.browser):
+            drvopts.add_argument(headless_arg)
+        drvopts.browser_version = opts.version
+        drvopts.binary_location = browser_config.browser_path
+        driver = _DRIVER_CACHE[key] = drv_cls(service=serv, options=drvopts)
+    yield driver
 
 
 @pytest.fixture
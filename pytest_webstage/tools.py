@@ -1,8 +1,28 @@
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING
 from click import group, progressbar, echo, option
-from .conf import read_config
+from .conf import Browser, Config, lookup_workers, read_config
 from selenium.webdriver.common.selenium_manager import SeleniumManager
 import json
 
+if TYPE_CHECKING:
+    from click._termui_impl import ProgressBar
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+_MGR: SeleniumManager | None = None
+
+
+def _get_mgr() -> SeleniumManager:
+    global _MGR
+    if _MGR is None:
+        _MGR = SeleniumManager()
+    return _MGR
+
+
 @group
 def webstage():
     pass
@@ -13,19 +33,33 @@ def webstage():
 def check_cache(offline: bool) -> None:
     """Check if the browsers and the drivers used are downloaded."""
     conf = read_config(".")
-    mgr = SeleniumManager()
-    results: list[dict] = []
-    with progressbar(conf.browsers, item_show_func=lambda x: f"{x.browser}({x.version})" if x else None) as pb:
-        for b in pb:
-            args = ["--browser", b.browser, "--browser-version", b.version]
-            if offline:
-                args.append("--offline")
-            if conf.cached_browsers == "always":
-                args.append("--force-browser-download")
-            elif conf.cached_browsers == "no":
-                args.append("--avoid-browser-download")
-            results.append(mgr.binary_paths(args))
-    echo(json.dumps(results, indent=2))
+    mgr = _get_mgr()
+    with ThreadPoolExecutor(max_workers=lookup_workers([conf.cached_browsers], len(conf.browsers))) as ex:
+        futures = {ex.submit(mgr.binary_paths, build_args(conf, b, offline)): b for b in conf.browsers}
+        pb: ProgressBar[Future[dict]]
+        with progressbar(
+            as_completed(futures),
+            length=len(futures),
+            item_show_func=lambda x: f"{futures[x].browser}({futures[x].version})" if x else None,
+        ) as pb:
+            for _ in pb:
+                pass
+    results: list[dict] = [fut.result() for fut in futures]
+    if orjson is not None:
+        echo(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
+        echo(json.dumps(results, indent=2))
+
+
+def build_args(conf: Config, b: Browser, offline: bool) -> list[str]:
+    args = ["--browser", b.browser, "--browser-version", b.version]
+    if offline:
+        args.append("--offline")
+    if conf.cached_browsers == "always":
+        args.append("--force-browser-download")
+    elif conf.cached_browsers == "no":
+        args.append("--avoid-browser-download")
+    return args
 
 @webstage.command
 def init() -> None:
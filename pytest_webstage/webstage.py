@@ -1,5 +1,6 @@
 from __future__ import annotations
 from asyncio import get_running_loop, Future, create_task, Queue, sleep
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Coroutine, ParamSpec, Callable, Protocol, TypeVar, Awaitable, AsyncContextManager, ContextManager
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -8,7 +9,9 @@ from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import partial
 import time
+import warnings
 
 
 __all__ = ["WebStage"]
@@ -17,9 +20,20 @@ _P = ParamSpec("_P")
 
 _T = TypeVar("_T")
 
+_CSS = By.CSS_SELECTOR
+
+# Bounds (in seconds) of the exponential backoff used when polling the document state.
+_POLL_MIN_DELAY = 0.001
+_POLL_MAX_DELAY = 0.05
+
+
+# WebDriver calls are blocking HTTP requests to the driver, they are run in
+# a pool owned by this module instead of the loop's default executor.
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="webstage")
+
 
 def _nsync(fn: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> Future[_T]:
-    return get_running_loop().run_in_executor(None, lambda args, kwargs: fn(*args, **kwargs), args, kwargs)  # type: ignore
+    return get_running_loop().run_in_executor(_EXECUTOR, partial(fn, *args, **kwargs))
 
 
 class SendKeyProtocol(Protocol):
@@ -27,14 +41,31 @@ class SendKeyProtocol(Protocol):
 
 
 class Keyboard(AsyncContextManager["Keyboard"], ContextManager["Keyboard"]):
+    """Emulate keyboard input on an element.
+
+    The keys are buffered until `flush()` or the end of the `with` block, and dropped if the block raises.
+    """
     def __init__(self, e: SendKeyProtocol) -> None:
         self.e = e
-
-    def _send_keys(self, value: str):
-        self.e.send_keys(value)
+        self._buf: list[str] = []
+
+    def flush(self):
+        """Send the buffered keys."""
+        if self._buf:
+            try:
+                self.e.send_keys(*self._buf)
+            finally:
+                self._buf.clear()
+
+    def __del__(self):
+        if self._buf:
+            warnings.warn(
+                f"keyboard discarded with unsent keys {self._buf!r}, use it in a with block or call flush()",
+                RuntimeWarning,
+            )
 
     def typing(self, value: str):
-        self._send_keys(value)
+        self._buf.append(value)
         return self
     
     def backspace(self):
@@ -56,30 +87,35 @@ class Keyboard(AsyncContextManager["Keyboard"], ContextManager["Keyboard"]):
         return self
     
     async def __aexit__(self, exc_typ, exc_val, tb):
+        if exc_typ is None:
+            await _nsync(self.flush)
+        else:
+            self._buf.clear()
         return None
     
     def __enter__(self):
         return self
     
     def __exit__(self, exc_typ, exc_val, tb):
+        if exc_typ is None:
+            self.flush()
+        else:
+            self._buf.clear()
         return None
 
 
 class SyncElement:
+    __slots__ = ("e",)
+
     def __init__(self, e: WebElement) -> None:
         self.e = e
 
     def query_selector(self, selector: str):
-        return list(
-            map(
-                Element,
-                map(SyncElement, self.e.find_elements(By.CSS_SELECTOR, selector)),
-            )
-        )
+        return [Element(SyncElement(e)) for e in self.e.find_elements(_CSS, selector)]
 
     def query_selector_one(self, selector: str):
         try:
-            return Element(SyncElement(self.e.find_element(By.CSS_SELECTOR, selector)))
+            return Element(SyncElement(self.e.find_element(_CSS, selector)))
         except NoSuchElementException:
             return None
 
@@ -95,6 +131,8 @@ class SyncElement:
 
 
 class Element:
+    __slots__ = ("e",)
+
     def __init__(self, e: SyncElement) -> None:
         self.e = e
 
@@ -114,7 +152,7 @@ class Element:
         return self.e.keyboard()
 
 
-@dataclass
+@dataclass(slots=True)
 class Cookie:
     name: str
     value: str
@@ -132,11 +170,14 @@ class Cookie:
 
 class SyncWebStage:
     """Synchronous API for web stage."""
+    __slots__ = ("driver",)
+
     def __init__(self, driver: WebDriver) -> None:
         self.driver = driver
 
     def go(self, name: int | str):
         if isinstance(name, int):
+            # back() and forward() wait for the navigation to finish, history.go() does not
             if name > 0:
                 for _ in range(name):
                     self.driver.forward()
@@ -147,17 +188,12 @@ class SyncWebStage:
             self.driver.get(name)
 
     def query_selector(self, selector: str):
-        return list(
-            map(
-                Element,
-                map(SyncElement, self.driver.find_elements(By.CSS_SELECTOR, selector)),
-            )
-        )
+        return [Element(SyncElement(e)) for e in self.driver.find_elements(_CSS, selector)]
 
     def query_selector_one(self, selector: str):
         try:
             return Element(
-                SyncElement(self.driver.find_element(By.CSS_SELECTOR, selector))
+                SyncElement(self.driver.find_element(_CSS, selector))
             )
         except NoSuchElementException:
             return None
@@ -182,16 +218,16 @@ class SyncWebStage:
         return bool(self.driver.execute_script("return document.readyState === 'complete'"))
 
     def until_ready(self):
+        delay = _POLL_MIN_DELAY
         while not self.is_ready():
-            time.sleep(0)
+            time.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX_DELAY)
 
     def capture_cookies(self) -> list[Cookie]:
-        result: list[Cookie] = []
-        a = self.driver.get_cookies()
-        for o in a:
-            c = Cookie.fromdict(o)
-            result.append(c)
-        return result
+        return [
+            Cookie(name=o['name'], value=o['value'], same_site=o['sameSite'])
+            for o in self.driver.get_cookies()
+        ]
 
     def get_cookie(self, name: str):
         if c := self.driver.get_cookie(name):
@@ -208,6 +244,8 @@ class WebStage:
     You can access sync API at `.sync`. Most of methods in this class is a `run-in-exectutor` version
     of the one in the sync API.
     """
+    __slots__ = ("sync", "parent", "description", "children")
+
     def __init__(self, sync: SyncWebStage, *, parent: WebStage | None = None, description: str | None = None) -> None:
         self.sync = sync
         self.parent = parent
@@ -218,6 +256,16 @@ class WebStage:
     def fromdriver(cls, driver: WebDriver):
         return cls(SyncWebStage(driver))
 
+    @classmethod
+    def configure_executor(cls, workers: int):
+        """Replace the thread pool running the async API with one of `workers` threads.
+
+        Calls already submitted to the old pool are completed in background.
+        """
+        global _EXECUTOR
+        old, _EXECUTOR = _EXECUTOR, ThreadPoolExecutor(max_workers=workers, thread_name_prefix="webstage")
+        old.shutdown(wait=False)
+
     def go(self, name: int | str):
         return _nsync(self.sync.go, name)
 
@@ -261,8 +309,11 @@ class WebStage:
         return _nsync(self.sync.is_ready)
 
     async def until_ready(self):
-        while not (await self.is_ready()):
-            await sleep(0)
+        loop = get_running_loop()
+        delay = _POLL_MIN_DELAY
+        while not (await loop.run_in_executor(_EXECUTOR, self.sync.is_ready)):
+            await sleep(delay)
+            delay = min(delay * 2, _POLL_MAX_DELAY)
 
     def capture_cookies(self):
         return _nsync(self.sync.capture_cookies)
@@ -0,0 +1,61 @@
+from pathlib import Path
+import pytest
+from pytest_webstage.conf import Browser, lookup_workers, read_config
+
+
+def write_config(tmp_path: Path, content: str):
+    (tmp_path / "webstage.toml").write_text(content)
+    return tmp_path
+
+
+def test_read_config(tmp_path: Path):
+    path = write_config(tmp_path, "\n".join([
+        "[tool.webstage]",
+        "cached_browsers = \"always\"",
+        "[[tool.webstage.browsers]]",
+        "browser = \"firefox\"",
+        "[[tool.webstage.browsers]]",
+        "browser = \"chrome\"",
+        "version = \"beta\"",
+    ]))
+    conf = read_config(path)
+    assert conf.cached_browsers == "always"
+    assert conf.browsers == (Browser("firefox", "stable"), Browser("chrome", "beta"))
+
+
+def test_read_config_defaults(tmp_path: Path):
+    conf = read_config(write_config(tmp_path, "[tool.webstage]\n"))
+    assert conf.cached_browsers == "auto"
+    assert conf.browsers == ()
+
+
+def test_read_config_is_shared_and_immutable(tmp_path: Path):
+    path = write_config(tmp_path, "[[tool.webstage.browsers]]\nbrowser = \"firefox\"\n")
+    conf = read_config(path)
+    assert read_config(path) is conf
+    assert isinstance(conf.browsers, tuple)
+
+
+def test_invalid_cached_browsers(tmp_path: Path):
+    path = write_config(tmp_path, "[tool.webstage]\ncached_browsers = \"sometimes\"\n")
+    with pytest.raises(ValueError, match="cached_browsers"):
+        read_config(path)
+
+
+def test_missing_browser_name(tmp_path: Path):
+    path = write_config(tmp_path, "[[tool.webstage.browsers]]\nversion = \"stable\"\n")
+    with pytest.raises(ValueError, match="webstage.toml"):
+        read_config(path)
+
+
+def test_invalid_version_type(tmp_path: Path):
+    path = write_config(tmp_path, "[[tool.webstage.browsers]]\nbrowser = \"chrome\"\nversion = 120\n")
+    with pytest.raises(ValueError, match="version"):
+        read_config(path)
+
+
+def test_lookup_workers():
+    assert lookup_workers(["auto", "no"], 3) == 3
+    assert lookup_workers(["auto"], 20) == 8
+    assert lookup_workers([], 0) == 1
+    assert lookup_workers(["auto", "always"], 3) == 1
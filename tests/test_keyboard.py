@@ -0,0 +1,72 @@
+import asyncio
+import gc
+import warnings
+import pytest
+from pytest_webstage.webstage import Keyboard
+
+
+class FakeElement:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, ...]] = []
+
+    def send_keys(self, *value: str):
+        self.sent.append(value)
+
+
+def test_keys_are_sent_in_one_call():
+    e = FakeElement()
+    with Keyboard(e) as kbd:
+        kbd.typing("hi").enter().typing("there")
+        assert e.sent == []
+    assert e.sent == [("hi", "\uE007", "there")]
+
+
+def test_flush_clears_buffer():
+    e = FakeElement()
+    with Keyboard(e) as kbd:
+        kbd.typing("a").flush()
+        kbd.typing("b")
+    assert e.sent == [("a",), ("b",)]
+
+
+def test_nothing_sent_on_exception():
+    e = FakeElement()
+    with pytest.raises(ValueError):
+        with Keyboard(e) as kbd:
+            kbd.typing("a")
+            raise ValueError()
+    assert e.sent == []
+
+
+def test_flush_clears_buffer_on_error():
+    class StaleElement:
+        def send_keys(self, *value: str):
+            raise RuntimeError("stale")
+
+    kbd = Keyboard(StaleElement()).typing("a")
+    with pytest.raises(RuntimeError):
+        kbd.flush()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        del kbd
+        gc.collect()
+    assert caught == []
+
+
+def test_async_context_flushes():
+    e = FakeElement()
+
+    async def main():
+        async with Keyboard(e) as kbd:
+            kbd.typing("a").tab()
+
+    asyncio.run(main())
+    assert e.sent == [("a", "\uE004")]
+
+
+def test_warns_when_discarded_with_unsent_keys():
+    e = FakeElement()
+    with pytest.warns(RuntimeWarning):
+        Keyboard(e).typing("a")
+        gc.collect()
+    assert e.sent == []
@@ -0,0 +1,259 @@
+import threading
+import time
+import pytest
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from pytest_webstage import plugin
+
+pytest_plugins = ["pytester"]
+
+
+class FakeAlert:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self.driver = driver
+
+    def dismiss(self):
+        self.driver.alerts.discard(self.driver.current_window_handle)
+
+
+class FakeSwitchTo:
+    def __init__(self, driver: "FakeDriver") -> None:
+        self.driver = driver
+
+    def window(self, handle: str):
+        self.driver.current_window_handle = handle
+
+    def new_window(self, kind: str):
+        handle = f"w{len(self.driver.urls)}"
+        self.driver.urls[handle] = "about:blank"
+        self.driver.current_window_handle = handle
+
+    @property
+    def alert(self):
+        if self.driver.current_window_handle not in self.driver.alerts:
+            raise NoAlertPresentException()
+        return FakeAlert(self.driver)
+
+
+class FakeDriver:
+    def __init__(self, service=None, options=None) -> None:
+        self.urls = {"w0": "about:blank"}
+        self.closed: set[str] = set()
+        self.alerts: set[str] = set()
+        self.cleared: list[str] = []
+        self.current_window_handle = "w0"
+        self.switch_to = FakeSwitchTo(self)
+        self.alive = True
+        self.quitted = False
+
+    @property
+    def window_handles(self):
+        if not self.alive:
+            raise WebDriverException("browser is gone")
+        return [h for h in self.urls if h not in self.closed]
+
+    @property
+    def current_url(self):
+        return self.urls[self.current_window_handle]
+
+    def get(self, url: str):
+        self.urls[self.current_window_handle] = url
+
+    def delete_all_cookies(self):
+        self.cleared.append(self.current_url)
+
+    def execute_script(self, script: str):
+        pass
+
+    def close(self):
+        self.closed.add(self.current_window_handle)
+
+    def quit(self):
+        self.quitted = True
+
+
+class FakeService:
+    def __init__(self, executable_path: str) -> None:
+        self.executable_path = executable_path
+
+
+class FakeOptions:
+    def __init__(self) -> None:
+        self.arguments: list[str] = []
+        self.browser_version = None
+        self.binary_location = None
+
+    def add_argument(self, arg: str):
+        self.arguments.append(arg)
+
+
+class FakeManager:
+    def __init__(self, fail: tuple[str, ...] = ()) -> None:
+        self.fail = fail
+        self.calls: list[list[str]] = []
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def binary_paths(self, args: list[str]) -> dict:
+        with self.lock:
+            self.calls.append(args)
+            self.running += 1
+            self.max_running = max(self.running, self.max_running)
+        time.sleep(0.05)
+        with self.lock:
+            self.running -= 1
+        browser = args[args.index("--browser") + 1]
+        if browser in self.fail:
+            raise RuntimeError(f"lookup failed: {browser}")
+        return {
+            "code": 0,
+            "message": "",
+            "driver_path": f"/drivers/{browser}",
+            "browser_path": f"/browsers/{browser}",
+        }
+
+    def browsers(self) -> list[str]:
+        return [args[args.index("--browser") + 1] for args in self.calls]
+
+
+@pytest.fixture
+def manager(monkeypatch: pytest.MonkeyPatch):
+    """Replace selenium manager and the plugin caches for in-process pytester runs."""
+    mgr = FakeManager()
+    monkeypatch.setattr(plugin, "_MGR", mgr)
+    monkeypatch.setattr(plugin, "_BINARY_PATHS_CACHE", {})
+    monkeypatch.setattr(plugin, "_PENDING_VARIANTS", {})
+    monkeypatch.setattr(plugin, "_DRIVER_CACHE", {})
+    return mgr
+
+
+def test_reset_driver_starts_a_fresh_tab():
+    driver = FakeDriver()
+    driver.get("http://a.test/")
+    driver.switch_to.new_window("tab")
+    driver.get("http://b.test/")
+    driver.alerts.add("w1")
+
+    plugin._reset_driver(driver)
+
+    assert driver.window_handles == ["w2"]
+    assert driver.current_window_handle == "w2"
+    assert driver.current_url == "about:blank"
+    assert driver.cleared == ["http://a.test/", "http://b.test/"]
+    assert driver.alerts == set()
+
+
+def test_browser_is_reused_and_replaced_when_gone(pytester: pytest.Pytester, manager: FakeManager, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setitem(plugin._BROWSER_REGISTRY, "firefox", (FakeService, FakeOptions, FakeDriver, "-headless"))
+    pytester.makepyfile(
+        """
+        DRIVERS = []
+
+        def test_a(browser):
+            DRIVERS.append(browser)
+
+        def test_b(browser):
+            DRIVERS.append(browser)
+            assert browser is DRIVERS[0]
+            browser.alive = False
+
+        def test_c(browser):
+            assert browser is not DRIVERS[0]
+            assert DRIVERS[0].quitted
+        """
+    )
+    result = pytester.runpytest("--browser", "firefox")
+    result.assert_outcomes(passed=3)
+
+
+BROWSER_CONFIG_TEST = """
+def test_a(browser_config):
+    assert browser_config.driver_path == f"/drivers/{browser_config.browser}"
+"""
+
+
+def test_duplicated_variants_are_collapsed(pytester: pytest.Pytester, manager: FakeManager):
+    pytester.makepyfile(BROWSER_CONFIG_TEST)
+    result = pytester.runpytest("--browser", "firefox", "--firefox-version", "stable", "esr", "stable", "-v")
+    result.assert_outcomes(passed=2)
+    result.stdout.fnmatch_lines(["*test_a?firefox(stable)?*", "*test_a?firefox(esr)?*"])
+    assert len(manager.calls) == 2
+
+
+def test_unsupported_config_browsers_are_reported_together(pytester: pytest.Pytester, manager: FakeManager):
+    pytester.makepyfile(BROWSER_CONFIG_TEST)
+    pytester.makefile(".toml", webstage="\n".join([
+        "[[tool.webstage.browsers]]",
+        "browser = \"safari\"",
+        "[[tool.webstage.browsers]]",
+        "browser = \"firefox\"",
+        "[[tool.webstage.browsers]]",
+        "browser = \"opera\"",
+    ]))
+    result = pytester.runpytest()
+    result.stdout.fnmatch_lines(["*unsupported browser names: safari ,opera.*"])
+    assert manager.calls == []
+
+
+def test_browser_option_does_not_read_config(pytester: pytest.Pytester, manager: FakeManager):
+    pytester.makepyfile(BROWSER_CONFIG_TEST)
+    pytester.makefile(".toml", webstage="this is not toml")
+    result = pytester.runpytest("--browser", "firefox")
+    result.assert_outcomes(passed=1)
+    assert manager.browsers() == ["firefox"]
+
+
+def test_browsers_from_config(pytester: pytest.Pytester, manager: FakeManager):
+    pytester.makepyfile(BROWSER_CONFIG_TEST)
+    pytester.makefile(".toml", webstage="\n".join([
+        "[tool.webstage]",
+        "cached_browsers = \"no\"",
+        "[[tool.webstage.browsers]]",
+        "browser = \"firefox\"",
+        "version = \"esr\"",
+    ]))
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=1)
+    assert manager.calls == [["--browser", "firefox", "--browser-version", "esr", "--avoid-browser-download"]]
+
+
+def test_deselected_variants_are_not_looked_up(pytester: pytest.Pytester, manager: FakeManager):
+    pytester.makepyfile(BROWSER_CONFIG_TEST)
+    result = pytester.runpytest("--browser", "firefox", "chrome", "-k", "firefox")
+    result.assert_outcomes(passed=1, deselected=1)
+    assert manager.browsers() == ["firefox"]
+
+
+def test_variants_are_looked_up_concurrently(pytester: pytest.Pytester, manager: FakeManager):
+    pytester.makepyfile(BROWSER_CONFIG_TEST)
+    result = pytester.runpytest("--browser", "firefox", "chrome")
+    result.assert_outcomes(passed=2)
+    assert manager.max_running == 2
+
+
+def test_forced_downloads_are_not_concurrent(pytester: pytest.Pytester, manager: FakeManager):
+    pytester.makepyfile(BROWSER_CONFIG_TEST)
+    pytester.makefile(".toml", webstage="\n".join([
+        "[tool.webstage]",
+        "cached_browsers = \"always\"",
+        "[[tool.webstage.browsers]]",
+        "browser = \"firefox\"",
+        "[[tool.webstage.browsers]]",
+        "browser = \"chrome\"",
+    ]))
+    result = pytester.runpytest()
+    result.assert_outcomes(passed=2)
+    assert len(manager.calls) == 2
+    assert manager.max_running == 1
+
+
+def test_failed_lookup_is_raised_from_cache(pytester: pytest.Pytester, manager: FakeManager):
+    manager.fail = ("chrome",)
+    pytester.makepyfile(BROWSER_CONFIG_TEST + """
+def test_b(browser_config):
+    pass
+""")
+    result = pytester.runpytest("--browser", "firefox", "chrome")
+    result.assert_outcomes(passed=2, errors=2)
+    result.stdout.fnmatch_lines(["*RuntimeError: lookup failed: chrome*"])
+    assert sorted(manager.browsers()) == ["chrome", "firefox"]